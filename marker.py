@@ -5,62 +5,356 @@ Double-click to run or: python marker.py
 """
 
 import tkinter as tk
-from tkinter import ttk, filedialog, scrolledtext, messagebox, simpledialog
+from tkinter import ttk, scrolledtext
+import asyncio
+import codecs
 import subprocess
 import threading
 import os
 import sys
-import shutil
 import json
-import urllib.request
 import urllib.parse
-import re
+import queue
+import shlex
+import functools
+import itertools
+import weakref
+from collections import defaultdict
 from pathlib import Path
 
+from marker_worker import STATUS_PREFIX
 
-class ToolTip:
-    """Simple tooltip that appears on hover with a delay."""
-    def __init__(self, widget, text, delay=500):
-        self.widget = widget
-        self.text = text
+# Favorites file (de)serialization: orjson when installed, else the stdlib
+try:
+    import orjson
+except ImportError:
+    json_loads = json.loads
+    
+    def json_dumps(obj):
+        return json.dumps(obj, indent=2).encode()
+else:
+    json_loads = orjson.loads
+    
+    def json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+
+IS_MAC = sys.platform == "darwin"
+IS_WIN = sys.platform == "win32"
+
+# Folder holding this script, the worker script, the .venv and saved favorites
+SCRIPT_DIR = Path(__file__).parent.resolve()
+
+# Platform-specific fonts, picked once at import
+MONO_FONT = ("Menlo", 11) if IS_MAC else ("Consolas", 10)
+TOOLTIP_FONT = ("TkDefaultFont", 10)
+
+# Trim the log back to LOG_KEEP_LINES once it grows past LOG_MAX_LINES
+LOG_MAX_LINES = 10000
+LOG_KEEP_LINES = 5000
+# Most queued log messages inserted per drain tick
+LOG_DRAIN_BATCH = 2000
+LOG_DRAIN_INTERVAL_MS = 50
+
+# File table rows are inserted this many at a time, as the user scrolls down
+TREE_PAGE_ROWS = 200
+
+
+def has_pdf_ext(name):
+    """True if name ends in .pdf, in any case."""
+    return name[-4:].lower() == ".pdf"
+
+
+def strip_pdf_ext(name):
+    """name without a trailing .pdf (in any case)."""
+    return name[:-4] if has_pdf_ext(name) else name
+
+
+@functools.lru_cache(maxsize=256)
+def folder_name(path):
+    """Last component of a favorite folder path, as shown in the combos."""
+    return Path(path).name
+
+
+@functools.lru_cache(maxsize=4096)
+def url_basename(url):
+    """Decoded last path component of a URL ("" if there is none)."""
+    return Path(urllib.parse.unquote(urllib.parse.urlparse(url).path)).name
+
+
+@functools.lru_cache(maxsize=4096)
+def extract_filename(path_or_url):
+    """Extract a clean filename (without extension) from a path or URL."""
+    if path_or_url.startswith(('http://', 'https://')):
+        filename = url_basename(path_or_url)
+    else:
+        filename = Path(path_or_url).name
+    
+    # Remove .pdf extension
+    return strip_pdf_ext(filename)
+
+
+def fast_move(src, dst, same_device=None):
+    """Move a file, renaming in place when src and dst share a filesystem.
+    
+    Falls back to shutil.move (copy, then delete) across filesystems.
+    same_device=False, known up front, skips straight to the fallback.
+    """
+    if same_device is not False:
+        try:
+            os.replace(src, dst)
+            return
+        except OSError:
+            pass
+    import shutil
+    shutil.move(src, dst)
+
+
+def fast_copy(src, dst):
+    """Copy a file and its metadata, like shutil.copy2.
+    
+    Where os.copy_file_range exists (Linux) the data never leaves the kernel,
+    and filesystems with reflinks (btrfs, XFS) can share blocks instead of
+    copying them. Anything that fails there falls back to shutil.copy2.
+    """
+    import shutil
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        raise OSError("copy_file_range copied nothing")
+                    remaining -= copied
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+
+
+def device_of(path):
+    """st_dev of path, or None if it can't be stat-ed (e.g. doesn't exist yet)."""
+    try:
+        return os.stat(path).st_dev
+    except OSError:
+        return None
+
+
+def output_target(project_folder, final_name):
+    """Key for where a PDF's output goes; equal keys mean the PDFs would clash.
+    
+    Compared the way the filesystem would: case-insensitively on Windows
+    and macOS.
+    """
+    target = os.path.normcase(os.path.abspath(os.path.join(project_folder, final_name)))
+    return target.casefold() if IS_MAC else target
+
+
+# Sent with URL downloads; some servers reject requests without a browser agent
+DOWNLOAD_HEADERS = {'User-Agent': 'Mozilla/5.0'}
+
+
+class DownloadProgress:
+    """Reports download progress to the GUI once per whole percent.
+    
+    Posting one Tk callback per network chunk floods the event queue on
+    large files; this coalesces them to at most ~100 per download.
+    """
+    def __init__(self, gui, total_size):
+        self.gui = gui
+        self.total_size = total_size
+        self.downloaded = 0
+        self.last_pct = -1
+    
+    def advance(self, nbytes):
+        self.downloaded += nbytes
+        if not self.total_size:
+            return
+        pct = int(self.downloaded * 100 / self.total_size)
+        if pct != self.last_pct:
+            self.last_pct = pct
+            self.gui.root.after(0, self.gui.update_download_progress, pct)
+
+
+class ToolTipManager:
+    """Shows hover tooltips for every attached widget with one shared window.
+    
+    A single pair of <Enter>/<Leave> bindings looks up the hovered widget's
+    text, and the same Toplevel is moved and relabelled for each tooltip.
+    """
+    def __init__(self, root, delay=500):
+        self.root = root
         self.delay = delay  # milliseconds
+        self.texts = weakref.WeakKeyDictionary()
         self.tipwindow = None
+        self.label = None
         self.scheduled_id = None
-        widget.bind("<Enter>", self.schedule_show)
-        widget.bind("<Leave>", self.hide)
+        self.current = None
+        root.bind_all("<Enter>", self.schedule_show, add="+")
+        root.bind_all("<Leave>", self.hide, add="+")
+    
+    def attach(self, widget, text):
+        """Show text when the mouse rests on widget."""
+        self.texts[widget] = text
     
-    def schedule_show(self, event=None):
+    def schedule_show(self, event):
+        try:
+            text = self.texts.get(event.widget)
+        except TypeError:
+            return  # Internal Tk widgets arrive as plain path strings
+        if text is None:
+            return
         self.hide()  # Cancel any existing tooltip
-        self.scheduled_id = self.widget.after(self.delay, self.show)
+        self.current = event.widget
+        self.scheduled_id = self.root.after(self.delay, self.show, text)
     
-    def show(self, event=None):
-        if self.tipwindow:
+    def show(self, text):
+        self.scheduled_id = None
+        widget = self.current
+        if widget is None or not widget.winfo_exists():
             return
-        x = self.widget.winfo_rootx() + 20
-        y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
-        self.tipwindow = tw = tk.Toplevel(self.widget)
-        tw.wm_overrideredirect(True)
-        tw.wm_geometry(f"+{x}+{y}")
-        # Set background to match tooltip for square appearance
-        tw.configure(background="#000000")
-        # Frame with border for square corners
-        frame = tk.Frame(tw, background="#ffffe0", bd=1, relief=tk.FLAT)
-        frame.pack(padx=1, pady=1)
-        label = tk.Label(
-            frame, text=self.text, justify=tk.LEFT,
-            background="#ffffe0", foreground="#000000",
-            font=("TkDefaultFont", 10),
-            padx=6, pady=4
-        )
-        label.pack()
+        if self.tipwindow is None:
+            self.tipwindow = tw = tk.Toplevel(self.root)
+            tw.wm_overrideredirect(True)
+            # Set background to match tooltip for square appearance
+            tw.configure(background="#000000")
+            # Frame with border for square corners
+            frame = tk.Frame(tw, background="#ffffe0", bd=1, relief=tk.FLAT)
+            frame.pack(padx=1, pady=1)
+            self.label = tk.Label(
+                frame, justify=tk.LEFT,
+                background="#ffffe0", foreground="#000000",
+                font=TOOLTIP_FONT,
+                padx=6, pady=4
+            )
+            self.label.pack()
+        x = widget.winfo_rootx() + 20
+        y = widget.winfo_rooty() + widget.winfo_height() + 5
+        self.label.config(text=text)
+        self.tipwindow.wm_geometry(f"+{x}+{y}")
+        self.tipwindow.deiconify()
+        self.tipwindow.lift()
     
     def hide(self, event=None):
+        if event is not None and event.widget is not self.current:
+            return
         if self.scheduled_id:
-            self.widget.after_cancel(self.scheduled_id)
+            self.root.after_cancel(self.scheduled_id)
             self.scheduled_id = None
         if self.tipwindow:
-            self.tipwindow.destroy()
-            self.tipwindow = None
+            self.tipwindow.withdraw()
+        self.current = None
+
+
+class MarkerWorker:
+    """A marker_worker.py process that converts PDFs one job at a time.
+    
+    The worker loads marker's models once at startup, so the import and
+    model-load cost is paid once per worker instead of once per PDF. Workers
+    stay loaded between batches until cancelled or the app closes.
+    """
+    def __init__(self, command, env):
+        self.command = command
+        self.env = env
+        self.process = None
+        self._pending = ""  # Output received after the last complete line
+        self._decoder = None
+    
+    async def start(self):
+        """Launch the worker process."""
+        self._pending = ""
+        # Keeps multi-byte characters split across reads intact
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self.process = await asyncio.create_subprocess_exec(
+            *self.command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            env=self.env
+        )
+    
+    @property
+    def alive(self):
+        return self.process is not None and self.process.returncode is None
+    
+    async def convert(self, job, log, prefix=""):
+        """Send one job and forward output until the worker reports back.
+        
+        Returns the worker's status dict, or None if it exited instead.
+        """
+        try:
+            self.process.stdin.write((json.dumps(job) + "\n").encode())
+            await self.process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            return None
+        return await self.read_status(log, prefix)
+    
+    async def read_status(self, log, prefix=""):
+        """Forward worker output to log until the next status line.
+        
+        Returns the status dict, or None if the worker exited instead.
+        """
+        while True:
+            chunk = await self.process.stdout.read(65536)
+            if not chunk:
+                # Whatever is left may hold full lines carried over from the last job
+                rest = (self._pending + self._decoder.decode(b"", final=True)).rstrip("\r")
+                self._pending = ""
+                lines = rest.split("\n")
+                if not lines[-1]:
+                    lines.pop()
+                if lines:
+                    log("".join(f"{prefix}{line}\n" for line in lines))
+                await self.process.wait()
+                return None
+            
+            text = self._pending + self._decoder.decode(chunk)
+            # A trailing \r may be half of a \r\n split across reads - keep it for later
+            held = "\r" if text.endswith("\r") else ""
+            if held:
+                text = text[:-1]
+            # Progress bars redraw with \r, show each update on its own line
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+            # Hold back the partial last line until the rest arrives
+            *lines, self._pending = text.split("\n")
+            self._pending += held
+            
+            output = []
+            for i, line in enumerate(lines):
+                pos = line.find(STATUS_PREFIX)
+                if pos == -1:
+                    output.append(f"{prefix}{line}\n")
+                    continue
+                if pos:
+                    output.append(f"{prefix}{line[:pos]}\n")
+                if output:
+                    log("".join(output))
+                # Anything after the status line belongs to the next job
+                self._pending = "\n".join(lines[i + 1:] + [self._pending])
+                return json.loads(line[pos + len(STATUS_PREFIX):])
+            if output:
+                log("".join(output))
+    
+    async def stop(self, timeout=10):
+        """Close stdin so the worker exits, terminating it if it lingers."""
+        if not self.alive:
+            return
+        self.process.stdin.close()
+        try:
+            await asyncio.wait_for(self.process.wait(), timeout)
+        except asyncio.TimeoutError:
+            self.terminate()
+            await self.process.wait()
+    
+    def terminate(self):
+        """Stop the worker immediately, abandoning any job in progress."""
+        if self.alive:
+            try:
+                self.process.terminate()
+            except ProcessLookupError:
+                pass  # Already exited
 
 
 class MarkerGUI:
@@ -70,53 +364,113 @@ class MarkerGUI:
         self.root.geometry("750x750")
         self.root.minsize(650, 650)
         
-        self.process = None
         self.is_running = False
-        self.pdf_files = []  # List of selected PDF files
+        self._log_queue = queue.SimpleQueue()  # Log messages waiting to be shown
+        self._log_drain_scheduled = False  # A _drain_log_queue call is pending
+        self._workers = {}  # Marker workers by number, kept between batches (event loop only)
+        self._page_range_arg = None  # marker --page_range value validated for the current batch
+        self._active_downloads = 0  # URL downloads in flight, counted on the Tk thread
+        
+        # Resolved once; the same for every PDF in every batch
+        self._worker_cmd = self.find_worker_command()
+        self._worker_cmd_display = shlex.join(self._worker_cmd)  # Quoted for the log
+        self._env = self.build_child_env()
+        
+        # Background event loop that drives all marker subprocesses
+        self._loop = asyncio.new_event_loop()
+        self.use_pidfd_child_watcher()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        self.pdf_files = {}  # Selected PDF files, in order, mapped to their display names
+        self._rows_shown = 0  # The first this many pdf_files have table rows
+        self._rows_wanted = TREE_PAGE_ROWS  # Rows to show, grown a page per scroll to the bottom
+        self._item_to_path = {}  # Maps table row id to its file path
         self.output_names = {}  # Maps file path to custom output name
         
-        # For inline editing
-        self.edit_entry = None
+        # For inline editing (the entry itself is created in setup_ui)
         self.editing_item = None
         
         # Favorites storage
-        self.favorites_file = Path(__file__).parent / ".marker_favorites.json"
+        self.favorites_file = SCRIPT_DIR / ".marker_favorites.json"
+        self._favorites_shown = None  # Output favorites last put in the combo
+        self._input_favorites_shown = None  # Input favorites last put in the combo
+        self._save_pending = None  # after() id of the debounced favorites save
         self.all_favorites = self.load_favorites()
         
         # Separate output and input favorites
         self.favorites = self.all_favorites.get("output", [])
         self.input_favorites = self.all_favorites.get("input", [])
         
+        # Downloads folder, checked once; used as a browse and download default
+        self._home_downloads = Path.home() / "Downloads"
+        self._home_downloads_exists = self._home_downloads.is_dir()
+        
         # Add default Downloads folder to input favorites if empty
-        downloads_folder = str(Path.home() / "Downloads")
-        if not self.input_favorites and Path(downloads_folder).exists():
-            self.input_favorites.append(downloads_folder)
+        if not self.input_favorites and self._home_downloads_exists:
+            self.input_favorites.append(str(self._home_downloads))
         
+        self.tooltips = ToolTipManager(self.root)
         self.setup_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+    
+    def use_pidfd_child_watcher(self):
+        """Wait for worker exits on the event loop instead of a thread per child.
+        
+        Before Python 3.12, asyncio on Unix starts a waitpid thread for every
+        subprocess. On Linux a pidfd lets the loop's selector watch all of them
+        alongside their stdout pipes. Python 3.12+ does this by itself.
+        """
+        if sys.version_info >= (3, 12) or not hasattr(os, "pidfd_open"):
+            return
+        try:
+            os.close(os.pidfd_open(os.getpid()))  # Needs Linux 5.3+
+        except OSError:
+            return
+        watcher = asyncio.PidfdChildWatcher()
+        watcher.attach_loop(self._loop)
+        asyncio.set_child_watcher(watcher)
     
     def load_favorites(self):
         """Load favorites from JSON file."""
         try:
-            if self.favorites_file.exists():
-                with open(self.favorites_file, 'r') as f:
-                    data = json.load(f)
-                    # Handle legacy format (list instead of dict)
-                    if isinstance(data, list):
-                        return {"output": data, "input": []}
-                    return data
+            data = json_loads(self.favorites_file.read_bytes())
+            # Handle legacy format (list instead of dict)
+            if isinstance(data, list):
+                return {"output": data, "input": []}
+            return data
         except Exception:
-            pass
+            pass  # Missing or unreadable file - start with no favorites
         return {"output": [], "input": []}
     
     def save_favorites(self):
-        """Save favorites to JSON file."""
+        """Schedule a save of the favorites, coalescing rapid changes into one write."""
+        if self._save_pending:
+            self.root.after_cancel(self._save_pending)
+        self._save_pending = self.root.after(500, self._do_save_favorites)
+    
+    def _do_save_favorites(self):
+        """Write favorites to the JSON file, replacing it atomically."""
+        from tkinter import messagebox
+        self._save_pending = None
+        tmp_file = self.favorites_file.with_name(self.favorites_file.name + ".tmp")
         try:
             data = {"output": self.favorites, "input": self.input_favorites}
-            with open(self.favorites_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            tmp_file.write_bytes(json_dumps(data))
+            os.replace(tmp_file, self.favorites_file)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save favorites: {e}")
     
+    def on_close(self):
+        """Flush any pending favorites save, stop the workers and close the window."""
+        if self._save_pending:
+            self.root.after_cancel(self._save_pending)
+            self._do_save_favorites()
+        
+        self.is_running = False
+        # Don't wait for it: the loop thread may itself be waiting on Tk (log,
+        # download progress), and workers exit by themselves once stdin closes
+        self._loop.call_soon_threadsafe(self._cancel_all)
+        self.root.destroy()
+    
     def setup_ui(self):
         # Main container with padding
         main_frame = ttk.Frame(self.root, padding="10")
@@ -150,13 +504,27 @@ class MarkerGUI:
         self.pdf_tree.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
         # Scrollbar for treeview
-        scrollbar = ttk.Scrollbar(tree_container, orient=tk.VERTICAL, command=self.pdf_tree.yview)
-        scrollbar.pack(side=tk.LEFT, fill=tk.Y)
-        self.pdf_tree.config(yscrollcommand=scrollbar.set)
+        self.tree_scrollbar = ttk.Scrollbar(tree_container, orient=tk.VERTICAL, command=self.pdf_tree.yview)
+        self.tree_scrollbar.pack(side=tk.LEFT, fill=tk.Y)
+        self.pdf_tree.config(yscrollcommand=self._on_tree_scroll)
         
         # Bind double-click for inline editing
         self.pdf_tree.bind("<Double-1>", self.on_double_click)
         
+        # One entry, placed over whichever cell is being edited (use tk.Entry for full style control)
+        self.edit_entry = tk.Entry(
+            self.pdf_tree,
+            background="#e0e0e0",         # Light grey background
+            foreground="#000000",          # Black text
+            insertbackground="#000000",    # Black cursor
+            selectbackground="#0078d7",
+            selectforeground="#ffffff",
+            relief=tk.FLAT
+        )
+        self.edit_entry.bind("<Return>", self.save_edit)
+        self.edit_entry.bind("<Escape>", lambda e: self.cancel_edit())
+        self.edit_entry.bind("<FocusOut>", self.save_edit)
+        
         # Buttons for file management - Row 1
         btn_container = ttk.Frame(file_frame)
         btn_container.pack(fill=tk.X, pady=(5, 0))
@@ -185,11 +553,14 @@ class MarkerGUI:
         self.input_fav_combo.pack(side=tk.LEFT, padx=(0, 5))
         self.input_fav_combo.bind("<<ComboboxSelected>>", self.on_input_favorite_selected)
         self.update_input_favorites_combo()
-        ToolTip(self.input_fav_combo, "Select folder and open file browser", delay=500)
+        self.tooltips.attach(self.input_fav_combo, "Select folder and open file browser")
         
         ttk.Button(fav_input_row, text="★ Add", command=self.add_input_favorite).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(fav_input_row, text="Remove", command=self.remove_input_favorite).pack(side=tk.LEFT)
         
+        # Download progress - packed on the right while a URL is downloading
+        self.download_bar = ttk.Progressbar(fav_input_row, mode="determinate", maximum=100, length=120)
+        
         # --- Output Directory Selection ---
         output_frame = ttk.LabelFrame(main_frame, text="Output Directory", padding="5")
         output_frame.pack(fill=tk.X, pady=(0, 10))
@@ -241,7 +612,7 @@ class MarkerGUI:
         self.pdf_action_combo = ttk.Combobox(
             checkbox_row,
             textvariable=self.pdf_action,
-            values=["Move PDF", "Copy PDF", "Symbolic Link", "Symbolic Backlink", "Do Nothing"],
+            values=["Move PDF", "Copy PDF", "Hard Link", "Symbolic Link", "Symbolic Backlink", "Do Nothing"],
             state="readonly",
             width=16
         )
@@ -251,11 +622,12 @@ class MarkerGUI:
         pdf_action_help = (
             "Move PDF: Move and rename PDF to output folder\n"
             "Copy PDF: Copy PDF to output folder (keeps original)\n"
+            "Hard Link: Hard link PDF into output folder, no copy (copies across drives)\n"
             "Symbolic Link: Create symlink in output pointing to original\n"
             "Symbolic Backlink: Move PDF to output, symlink back to original location\n"
             "Do Nothing: Leave PDF in place, only create marker output"
         )
-        ToolTip(self.pdf_action_combo, pdf_action_help)
+        self.tooltips.attach(self.pdf_action_combo, pdf_action_help)
         
         # --- Page Range Selection ---
         page_frame = ttk.LabelFrame(main_frame, text="Page Range", padding="5")
@@ -309,7 +681,22 @@ class MarkerGUI:
             command=self.cancel_conversion,
             state=tk.DISABLED
         )
-        self.cancel_btn.pack(side=tk.LEFT)
+        self.cancel_btn.pack(side=tk.LEFT, padx=(0, 20))
+        
+        # Number of PDFs converted in parallel
+        ttk.Label(button_frame, text="Workers:").pack(side=tk.LEFT, padx=(0, 5))
+        # Each worker holds its own copy of marker's models, so default to a few
+        cpu_count = os.cpu_count() or 1
+        self.max_workers = tk.StringVar(value=str(min(cpu_count, 4)))
+        self.max_workers_spin = ttk.Spinbox(
+            button_frame,
+            textvariable=self.max_workers,
+            from_=1,
+            to=cpu_count,
+            width=4
+        )
+        self.max_workers_spin.pack(side=tk.LEFT)
+        self.tooltips.attach(self.max_workers_spin, "Number of PDFs to convert at the same time")
         
         self.clear_btn = ttk.Button(
             button_frame,
@@ -318,6 +705,8 @@ class MarkerGUI:
         )
         self.clear_btn.pack(side=tk.RIGHT)
         
+        ttk.Button(button_frame, text="Save Log", command=self.save_log).pack(side=tk.RIGHT, padx=(0, 5))
+        
         # --- Terminal Log Output ---
         log_frame = ttk.LabelFrame(main_frame, text="Terminal Output", padding="5")
         log_frame.pack(fill=tk.BOTH, expand=True)
@@ -325,17 +714,28 @@ class MarkerGUI:
         self.log_text = scrolledtext.ScrolledText(
             log_frame,
             wrap=tk.WORD,
-            font=("Menlo", 11) if sys.platform == "darwin" else ("Consolas", 10),
+            font=MONO_FONT,
             bg="#1e1e1e",
             fg="#d4d4d4",
             insertbackground="#d4d4d4"
         )
         self.log_text.pack(fill=tk.BOTH, expand=True)
         self.log_text.config(state=tk.DISABLED)
+        
+        # Colors for batch headers and results
+        self.log_text.tag_configure("hdr", foreground="#9cdcfe")
+        self.log_text.tag_configure("ok", foreground="#6a9955")
+        self.log_text.tag_configure("err", foreground="#f48771")
     
     def update_favorites_combo(self):
         """Update the favorites combobox with current favorites."""
-        display_names = [Path(f).name for f in self.favorites]
+        # Nothing to do if the combo already lists these favorites
+        favorites = tuple(self.favorites)
+        if favorites == self._favorites_shown:
+            return
+        self._favorites_shown = favorites
+        
+        display_names = [folder_name(f) for f in favorites]
         self.favorites_combo['values'] = display_names
         if not display_names:
             self.favorites_var.set("")
@@ -348,6 +748,7 @@ class MarkerGUI:
     
     def add_to_favorites(self):
         """Add current output directory to favorites."""
+        from tkinter import messagebox
         path = self.output_path.get().strip()
         if not path:
             messagebox.showwarning("No Directory", "Please enter an output directory first.")
@@ -369,7 +770,13 @@ class MarkerGUI:
     
     def update_input_favorites_combo(self):
         """Update the input favorites combobox."""
-        display_names = [Path(f).name for f in self.input_favorites]
+        # Nothing to do if the combo already lists these favorites
+        favorites = tuple(self.input_favorites)
+        if favorites == self._input_favorites_shown:
+            return
+        self._input_favorites_shown = favorites
+        
+        display_names = [folder_name(f) for f in favorites]
         self.input_fav_combo['values'] = display_names
         if display_names:
             self.input_fav_combo.current(0)
@@ -384,14 +791,14 @@ class MarkerGUI:
         idx = self.input_fav_combo.current()
         if idx >= 0 and idx < len(self.input_favorites):
             path = self.input_favorites[idx]
-            if Path(path).exists():
+            if os.path.isdir(path):
                 return path
         # Fallback to Downloads or home
-        downloads = Path.home() / "Downloads"
-        return str(downloads) if downloads.exists() else str(Path.home())
+        return str(self._home_downloads) if self._home_downloads_exists else str(Path.home())
     
     def add_input_favorite(self):
         """Add a directory to input favorites."""
+        from tkinter import filedialog, messagebox
         directory = filedialog.askdirectory(title="Select Folder to Add to Favorites")
         if directory:
             if directory not in self.input_favorites:
@@ -405,6 +812,7 @@ class MarkerGUI:
     
     def remove_input_favorite(self):
         """Remove selected input favorite."""
+        from tkinter import messagebox
         idx = self.input_fav_combo.current()
         if idx >= 0 and idx < len(self.input_favorites):
             del self.input_favorites[idx]
@@ -415,21 +823,31 @@ class MarkerGUI:
     
     def open_output_directory(self):
         """Open the output directory in the system file manager."""
+        from tkinter import messagebox
         path = self.output_path.get().strip()
         if not path:
             messagebox.showwarning("No Directory", "Please enter an output directory first.")
             return
-        if not Path(path).exists():
+        if not os.path.isdir(path):
             messagebox.showwarning("Directory Not Found", f"Directory does not exist:\n{path}")
             return
         
+        if IS_MAC:
+            cmd = ["open", path]
+        elif IS_WIN:
+            cmd = ["explorer", path]
+        else:
+            cmd = ["xdg-open", path]
+        
+        # Fire and forget - don't block the GUI while the file manager starts
         try:
-            if sys.platform == "darwin":
-                subprocess.run(["open", path])
-            elif sys.platform == "win32":
-                subprocess.run(["explorer", path])
-            else:
-                subprocess.run(["xdg-open", path])
+            subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=True
+            )
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open directory: {e}")
     
@@ -456,25 +874,14 @@ class MarkerGUI:
         if not bbox:
             return
         
-        # Destroy any existing edit entry
+        # Hide any edit in progress
         self.cancel_edit()
         
-        # Get current value (strip .pdf for editing)
-        values = self.pdf_tree.item(item, "values")
-        current_output_name = values[1] if len(values) > 1 else ""
-        if current_output_name.lower().endswith(".pdf"):
-            current_output_name = current_output_name[:-4]
+        # Get current value (stored without .pdf)
+        current_output_name = self.output_names.get(self._item_to_path.get(item), "")
         
-        # Create entry widget for editing (use tk.Entry for full style control)
-        self.edit_entry = tk.Entry(
-            self.pdf_tree,
-            background="#e0e0e0",         # Light grey background
-            foreground="#000000",          # Black text
-            insertbackground="#000000",    # Black cursor
-            selectbackground="#0078d7",
-            selectforeground="#ffffff",
-            relief=tk.FLAT
-        )
+        # Reuse the edit entry for this cell
+        self.edit_entry.delete(0, tk.END)
         self.edit_entry.insert(0, current_output_name)
         self.edit_entry.select_range(0, tk.END)
         
@@ -483,82 +890,101 @@ class MarkerGUI:
         self.edit_entry.focus_set()
         
         self.editing_item = item
-        
-        # Bind events for saving/canceling
-        self.edit_entry.bind("<Return>", self.save_edit)
-        self.edit_entry.bind("<Escape>", lambda e: self.cancel_edit())
-        self.edit_entry.bind("<FocusOut>", self.save_edit)
     
     def save_edit(self, event=None):
         """Save the edited output name."""
-        if not self.edit_entry or not self.editing_item:
+        if not self.editing_item:
             return
         
         new_value = self.edit_entry.get().strip()
         item = self.editing_item
         
         # Normalize: remove .pdf extension if user added it
-        if new_value.lower().endswith(".pdf"):
-            new_value = new_value[:-4].strip()
+        new_value = strip_pdf_ext(new_value).strip()
         
-        # Get the file path from tag
-        tags = self.pdf_tree.item(item, "tags")
-        if tags:
-            file_path = tags[0]
+        file_path = self._item_to_path.get(item)
+        if file_path is not None:
             self.output_names[file_path] = new_value
-        
-        # Update treeview - display with .pdf extension if name is provided
-        values = list(self.pdf_tree.item(item, "values"))
-        values[1] = f"{new_value}.pdf" if new_value else ""
-        self.pdf_tree.item(item, values=values)
+            
+            # Update treeview - display with .pdf extension if name is provided
+            output_display = f"{new_value}.pdf" if new_value else ""
+            self.pdf_tree.item(item, values=(self.pdf_files[file_path], output_display))
         
         self.cancel_edit()
     
     def cancel_edit(self):
         """Cancel inline editing."""
-        if self.edit_entry:
-            self.edit_entry.destroy()
-            self.edit_entry = None
+        # Cleared first so the <FocusOut> from hiding the entry doesn't save
         self.editing_item = None
+        self.edit_entry.place_forget()
     
     def get_filename_from_path_or_url(self, path_or_url):
         """Extract a clean filename (without extension) from a path or URL."""
-        if path_or_url.startswith(('http://', 'https://')):
-            # Parse URL to get filename
-            parsed = urllib.parse.urlparse(path_or_url)
-            filename = Path(urllib.parse.unquote(parsed.path)).name
-        else:
-            filename = Path(path_or_url).name
-        
-        # Remove .pdf extension
-        if filename.lower().endswith('.pdf'):
-            filename = filename[:-4]
-        
-        return filename
+        return extract_filename(path_or_url)
     
     def add_pdf_to_list(self, file_path, display_name=None):
         """Add a PDF file to the list with auto-filled output name."""
+        if not self._add_pdf_entry(file_path, display_name):
+            return False
+        self._fill_tree()
+        return True
+    
+    def _add_pdf_entry(self, file_path, display_name=None):
+        """Record a PDF and its output name; _fill_tree gives it a row."""
         if file_path in self.pdf_files:
             return False
         
-        self.pdf_files.append(file_path)
+        self.pdf_files[file_path] = display_name if display_name else Path(file_path).name
         
         # Auto-fill output name with the filename
         base_name = self.get_filename_from_path_or_url(display_name or file_path)
         self.output_names[file_path] = base_name
-        
-        # Insert into treeview with file path as tag
-        display = display_name if display_name else Path(file_path).name
-        self.pdf_tree.insert(
-            "",
-            tk.END,
-            values=(display, f"{base_name}.pdf"),
-            tags=(file_path,)
-        )
         return True
     
+    def _fill_tree(self):
+        """Insert table rows for pdf_files up to the number scrolled into view so far."""
+        wanted = min(len(self.pdf_files), self._rows_wanted)
+        if self._rows_shown >= wanted:
+            return
+        
+        # Insert into treeview, remembering each row's file path
+        for file_path in itertools.islice(self.pdf_files, self._rows_shown, wanted):
+            output_name = self.output_names.get(file_path, "")
+            item = self.pdf_tree.insert(
+                "",
+                tk.END,
+                values=(self.pdf_files[file_path], f"{output_name}.pdf" if output_name else "")
+            )
+            self._item_to_path[item] = file_path
+        self._rows_shown = wanted
+    
+    def _on_tree_scroll(self, first, last):
+        """Update the scrollbar, loading the next page of rows at the bottom."""
+        self.tree_scrollbar.set(first, last)
+        if float(last) >= 1.0 and self._rows_shown < len(self.pdf_files):
+            self._rows_wanted = self._rows_shown + TREE_PAGE_ROWS
+            self.root.after_idle(self._fill_tree)
+    
+    def add_pdf_batch(self, file_paths):
+        """Add several PDFs at once, laying out the table only after the last row."""
+        # dict.fromkeys drops repeats within the batch, keeping order
+        new_paths = [f for f in dict.fromkeys(file_paths) if f not in self.pdf_files]
+        if not new_paths:
+            return
+        
+        for file_path in new_paths:
+            self._add_pdf_entry(file_path)
+        
+        # With no columns displayed, inserts skip per-row cell layout
+        self.pdf_tree.configure(displaycolumns=())
+        try:
+            self._fill_tree()
+        finally:
+            self.pdf_tree.configure(displaycolumns="#all")
+    
     def browse_pdf(self):
         """Open file dialog to select multiple PDFs."""
+        from tkinter import filedialog
         start_dir = self.get_input_start_directory()
         filenames = filedialog.askopenfilenames(
             title="Select PDF Files",
@@ -566,14 +992,14 @@ class MarkerGUI:
             filetypes=[("PDF Files", "*.pdf"), ("All Files", "*.*")]
         )
         if filenames:
-            for filename in filenames:
-                self.add_pdf_to_list(filename)
+            self.add_pdf_batch(filenames)
             # Auto-set output directory to same as first PDF location
             if not self.output_path.get() and self.pdf_files:
-                self.output_path.set(str(Path(self.pdf_files[0]).parent))
+                self.output_path.set(str(Path(next(iter(self.pdf_files))).parent))
     
     def add_url(self):
         """Prompt user for a PDF URL and download it."""
+        from tkinter import messagebox, simpledialog
         url = simpledialog.askstring(
             "Add PDF from URL",
             "Enter the URL of a PDF file:",
@@ -591,9 +1017,7 @@ class MarkerGUI:
             return
         
         # Check if it looks like a PDF
-        parsed = urllib.parse.urlparse(url)
-        path_lower = parsed.path.lower()
-        if not path_lower.endswith('.pdf'):
+        if not has_pdf_ext(urllib.parse.urlparse(url).path):
             result = messagebox.askyesno(
                 "Not a PDF?",
                 "The URL doesn't end with .pdf. Continue anyway?"
@@ -601,88 +1025,136 @@ class MarkerGUI:
             if not result:
                 return
         
-        # Download in background
+        # Download on the background event loop
         self.log(f"Downloading: {url}\n")
-        thread = threading.Thread(target=self.download_pdf, args=(url,), daemon=True)
-        thread.start()
+        self._active_downloads += 1
+        asyncio.run_coroutine_threadsafe(self.download_pdf(url), self._loop)
     
-    def download_pdf(self, url):
-        """Download a PDF from URL in background thread."""
+    async def download_pdf(self, url):
+        """Download a PDF from URL on the background event loop."""
+        dest_path = None
         try:
             # Get filename from URL
-            parsed = urllib.parse.urlparse(url)
-            filename = Path(urllib.parse.unquote(parsed.path)).name
-            if not filename or not filename.lower().endswith('.pdf'):
+            url_name = url_basename(url)
+            filename = url_name
+            if not has_pdf_ext(filename):
                 filename = "downloaded.pdf"
             
             # Use the user's Downloads folder
-            download_dir = Path.home() / "Downloads"
-            if not download_dir.exists():
+            download_dir = self._home_downloads
+            if not self._home_downloads_exists:
                 download_dir.mkdir(parents=True, exist_ok=True)
+                self._home_downloads_exists = True
             
-            # Make filename unique if it already exists
-            dest_path = download_dir / filename
+            # Make filename unique, reserving it so concurrent downloads can't collide
+            candidate = download_dir / filename
             counter = 1
-            while dest_path.exists():
-                stem = Path(filename).stem
-                dest_path = download_dir / f"{stem}_{counter}.pdf"
-                counter += 1
+            while True:
+                try:
+                    candidate.touch(exist_ok=False)
+                    break
+                except FileExistsError:
+                    candidate = download_dir / f"{Path(filename).stem}_{counter}.pdf"
+                    counter += 1
+            dest_path = candidate
             
             # Download with progress
-            self.root.after(0, self.log, f"Saving to: {dest_path}\n")
+            self.log(f"Saving to: {dest_path}\n")
             
-            req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-            with urllib.request.urlopen(req, timeout=60) as response:
-                total_size = response.headers.get('Content-Length')
-                if total_size:
-                    total_size = int(total_size)
-                
-                with open(dest_path, 'wb') as f:
-                    downloaded = 0
-                    chunk_size = 8192
-                    while True:
-                        chunk = response.read(chunk_size)
-                        if not chunk:
-                            break
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        if total_size:
-                            pct = (downloaded / total_size) * 100
-                            self.root.after(0, self.update_download_progress, pct)
+            try:
+                import aiohttp
+            except ImportError:
+                # Without aiohttp, stream with urllib on a helper thread
+                await asyncio.to_thread(self._download_with_urllib, url, dest_path)
+            else:
+                await self._download_with_aiohttp(aiohttp, url, dest_path)
             
-            self.root.after(0, self.log, f"\n✓ Download complete!\n\n")
+            self.log(f"\n✓ Download complete!\n\n", "ok")
             
             # Add to list on main thread
-            display_name = Path(urllib.parse.unquote(parsed.path)).name
-            self.root.after(0, self.add_pdf_to_list, str(dest_path), display_name)
+            self.root.after(0, self.add_pdf_to_list, str(dest_path), url_name)
             
         except Exception as e:
-            self.root.after(0, self.log, f"\n✗ Download failed: {e}\n\n")
+            self.log(f"\n✗ Download failed: {e}\n\n", "err")
+            if dest_path is not None:
+                dest_path.unlink(missing_ok=True)
+        finally:
+            self.root.after(0, self.download_finished)
+    
+    async def _download_with_aiohttp(self, aiohttp, url, dest_path):
+        """Stream url to dest_path with aiohttp."""
+        timeout = aiohttp.ClientTimeout(sock_connect=60, sock_read=60)
+        async with aiohttp.ClientSession(headers=DOWNLOAD_HEADERS, timeout=timeout) as session:
+            async with session.get(url) as response:
+                response.raise_for_status()
+                progress = DownloadProgress(self, response.content_length)
+                with open(dest_path, 'wb') as f:
+                    async for chunk in response.content.iter_chunked(262144):
+                        f.write(chunk)
+                        progress.advance(len(chunk))
+    
+    def _download_with_urllib(self, url, dest_path):
+        """Stream url to dest_path with urllib (blocking)."""
+        import shutil
+        import urllib.request
+        req = urllib.request.Request(url, headers=DOWNLOAD_HEADERS)
+        with urllib.request.urlopen(req, timeout=60) as response:
+            total_size = response.headers.get('Content-Length')
+            progress = DownloadProgress(self, int(total_size) if total_size else None)
+            
+            with open(dest_path, 'wb') as f:
+                if not progress.total_size:
+                    # No size to report progress against - just copy in big blocks
+                    shutil.copyfileobj(response, f, length=1 << 20)
+                    return
+                
+                chunk_size = 262144
+                while True:
+                    chunk = response.read(chunk_size)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    progress.advance(len(chunk))
     
     def update_download_progress(self, pct):
-        """Update download progress in log (overwrites last line)."""
-        # Simple progress update
-        pass  # Could add a progress bar here
+        """Show download progress in the quick open row."""
+        if not self.download_bar.winfo_ismapped():
+            self.download_bar.pack(side=tk.RIGHT)
+        self.download_bar['value'] = pct
+    
+    def download_finished(self):
+        """Hide the progress bar once no downloads are left."""
+        self._active_downloads -= 1
+        if self._active_downloads <= 0:
+            self._active_downloads = 0
+            self.download_bar.pack_forget()
+            self.download_bar['value'] = 0
     
     def remove_selected_files(self):
         """Remove selected files from the list."""
         selected = self.pdf_tree.selection()
+        if not selected:
+            return
+        
+        # Dict removal is O(1) per file and keeps the remaining order
         for item in selected:
-            tags = self.pdf_tree.item(item, "tags")
-            if tags:
-                file_path = tags[0]
-                if file_path in self.pdf_files:
-                    self.pdf_files.remove(file_path)
-                if file_path in self.output_names:
-                    del self.output_names[file_path]
-            self.pdf_tree.delete(item)
+            file_path = self._item_to_path.pop(item)
+            self.pdf_files.pop(file_path, None)
+            self.output_names.pop(file_path, None)
+        
+        # One Tk call deletes every selected row, then rows not yet shown move up
+        self.pdf_tree.delete(*selected)
+        self._rows_shown -= len(selected)
+        self._fill_tree()
     
     def clear_files(self):
         """Clear all files, output directory, and log."""
         # Clear treeview
-        for item in self.pdf_tree.get_children():
-            self.pdf_tree.delete(item)
+        self.pdf_tree.delete(*self.pdf_tree.get_children())
         self.pdf_files.clear()
+        self._item_to_path.clear()
+        self._rows_shown = 0
+        self._rows_wanted = TREE_PAGE_ROWS
         self.output_names.clear()
         
         # Clear output path
@@ -693,6 +1165,7 @@ class MarkerGUI:
     
     def browse_output(self):
         """Open directory dialog to select output folder."""
+        from tkinter import filedialog
         directory = filedialog.askdirectory(title="Select Output Directory")
         if directory:
             self.output_path.set(directory)
@@ -703,12 +1176,61 @@ class MarkerGUI:
         self.start_entry.config(state=state)
         self.end_entry.config(state=state)
     
-    def log(self, message):
-        """Append message to log output."""
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, message)
-        self.log_text.see(tk.END)
-        self.log_text.config(state=tk.DISABLED)
+    def log(self, message, tag=None):
+        """Queue message for the log output (safe to call from any thread).
+        
+        tag is an optional log_text tag name ("hdr", "ok" or "err") to color it.
+        """
+        self._log_queue.put((message, tag))
+        if not self._log_drain_scheduled:
+            self._schedule_log_drain()
+    
+    def _schedule_log_drain(self):
+        """Drain the log queue shortly, collecting whatever arrives meanwhile."""
+        self._log_drain_scheduled = True
+        self.root.after(LOG_DRAIN_INTERVAL_MS, self._drain_log_queue)
+    
+    def _drain_log_queue(self):
+        """Insert all queued log messages with a single widget update."""
+        # Cleared before draining, so a message queued from here on schedules a new drain
+        self._log_drain_scheduled = False
+        chunks = []
+        try:
+            while len(chunks) < LOG_DRAIN_BATCH:
+                chunks.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if chunks:
+            # Merge runs of same-tag messages into (text, tags) pairs so the
+            # whole batch, colored headers included, is one Text.insert call
+            insert_args = []
+            run, run_tag = [], None
+            for message, tag in chunks:
+                if run and tag != run_tag:
+                    insert_args += ["".join(run), run_tag or ()]
+                    run = []
+                run.append(message)
+                run_tag = tag
+            insert_args += ["".join(run), run_tag or ()]
+            
+            # Only follow new output if the user hasn't scrolled up to read
+            at_bottom = self.log_text.yview()[1] >= 0.99
+            
+            self.log_text.config(state=tk.NORMAL)
+            self.log_text.insert(tk.END, *insert_args)
+            # Keep the widget from growing without bound on long batches
+            lines = int(self.log_text.index("end-1c").split(".")[0])
+            if lines > LOG_MAX_LINES:
+                self.log_text.delete("1.0", f"{lines - LOG_KEEP_LINES}.0")
+            self.log_text.config(state=tk.DISABLED)
+            
+            if at_bottom:
+                self.log_text.see(tk.END)
+        
+        # More than one batch was waiting - come back for the rest
+        if len(chunks) == LOG_DRAIN_BATCH and not self._log_drain_scheduled:
+            self._schedule_log_drain()
     
     def clear_log(self):
         """Clear the log output."""
@@ -716,53 +1238,111 @@ class MarkerGUI:
         self.log_text.delete(1.0, tk.END)
         self.log_text.config(state=tk.DISABLED)
     
+    def save_log(self):
+        """Save the log output (the most recent lines kept in the widget) to a file."""
+        from tkinter import filedialog, messagebox
+        filename = filedialog.asksaveasfilename(
+            title="Save Log",
+            defaultextension=".txt",
+            initialfile="marker_log.txt",
+            filetypes=[("Text Files", "*.txt"), ("All Files", "*.*")]
+        )
+        if not filename:
+            return
+        
+        # Include anything still waiting in the queue
+        self._drain_log_queue()
+        try:
+            Path(filename).write_text(self.log_text.get("1.0", "end-1c"), encoding="utf-8")
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to save log: {e}")
+    
     def get_final_name(self, pdf_path):
         """Get the final output name for a PDF (without extension)."""
         custom_name = self.output_names.get(pdf_path, "").strip()
         if custom_name:
             # Remove .pdf extension if user accidentally added it
-            if custom_name.lower().endswith(".pdf"):
-                custom_name = custom_name[:-4]
-            return custom_name
+            return strip_pdf_ext(custom_name)
         else:
             # Use original filename without extension
             return Path(pdf_path).stem
     
-    def get_marker_command(self, pdf_path, output_dir):
-        """Build the marker CLI command for a single PDF."""
-        # Find marker_single in the virtual environment
-        script_dir = Path(__file__).parent.resolve()
-        venv_bin = script_dir / ".venv" / ("Scripts" if sys.platform == "win32" else "bin")
-        marker_cmd = venv_bin / ("marker_single.exe" if sys.platform == "win32" else "marker_single")
-        
-        if not marker_cmd.exists():
-            # Fallback to system PATH
-            marker_cmd = "marker_single"
-        else:
-            marker_cmd = str(marker_cmd)
-        
-        cmd = [marker_cmd, pdf_path, "--output_dir", output_dir]
-        
-        # Add page range if not all pages
-        if not self.all_pages.get():
+    def find_worker_command(self):
+        """Build the command that starts a marker worker process.
+        
+        Prefers the virtual environment's Python, where marker-pdf is installed,
+        then the Python of a marker_single on PATH (pipx, conda or another env).
+        All choices are absolute paths, which spares the child a PATH lookup
+        and keeps subprocess on its posix_spawn fast path.
+        """
+        venv_bin = SCRIPT_DIR / ".venv" / ("Scripts" if IS_WIN else "bin")
+        python = venv_bin / ("python.exe" if IS_WIN else "python")
+        
+        if not python.exists():
+            # Fallback to the interpreter running the GUI
+            python = self.find_marker_python() or sys.executable
+        return [str(python), str(SCRIPT_DIR / "marker_worker.py")]
+    
+    def find_marker_python(self):
+        """Python of the environment whose marker_single is on PATH, or None."""
+        import shutil
+        script = shutil.which("marker_single")
+        if script is None:
+            return None
+        script = Path(script).resolve()  # pipx links it in from its venv
+        
+        # A script installed by pip names its interpreter in the shebang
+        if not IS_WIN:
             try:
-                # Convert 1-based user input to 0-based for marker
-                start = int(self.start_page.get()) - 1
-                end = int(self.end_page.get()) - 1
-                
-                if start < 0 or end < start:
-                    raise ValueError("Invalid page range")
-                
-                cmd.extend(["--page_range", f"{start}-{end}"])
-            except ValueError as e:
-                messagebox.showerror("Invalid Page Range", 
-                    "Please enter valid page numbers.\nStart page must be >= 1 and <= End page.")
-                return None
-        
-        return cmd
+                with open(script, "rb") as f:
+                    shebang = f.readline().decode(errors="replace")
+            except OSError:
+                shebang = ""
+            parts = shebang[2:].split() if shebang.startswith("#!") else []
+            if parts and Path(parts[0]).name.startswith("python") and os.path.exists(parts[0]):
+                return parts[0]
+        
+        # Otherwise look beside it (venv, pipx) or one level up (Windows conda)
+        name = "python.exe" if IS_WIN else "python"
+        for folder in (script.parent, script.parent.parent):
+            if (folder / name).exists():
+                return folder / name
+        return None
+    
+    def build_child_env(self):
+        """Environment for marker subprocesses.
+        
+        Returns None (inherit ours unchanged, no copy) when unbuffered output
+        is already enabled, otherwise a single copy with it switched on.
+        """
+        if os.environ.get("PYTHONUNBUFFERED"):
+            return None
+        env = os.environ.copy()
+        env["PYTHONUNBUFFERED"] = "1"
+        return env
+    
+    def get_marker_job(self, pdf_path, output_folder, base_name, page_range_arg=None):
+        """Build the marker worker job for a single PDF.
+        
+        output_folder is the folder marker saves into, used as-is, and base_name
+        the name (without extension) of the markdown file it writes there.
+        page_range_arg is the marker page range string from validate_page_range,
+        or None to convert all pages.
+        """
+        job = {"pdf": pdf_path, "output_folder": output_folder, "base_name": base_name}
+        if page_range_arg is not None:
+            job["page_range"] = page_range_arg
+        return job
     
     def validate_page_range(self):
-        """Validate page range inputs before starting conversion."""
+        """Validate page range inputs before starting conversion.
+        
+        Stores marker's 0-based "start-end" range in self._page_range_arg, or
+        None when converting all pages. Returns False if the range is invalid.
+        Runs once per batch; PDFs in the batch reuse the stored value.
+        """
+        from tkinter import messagebox
+        self._page_range_arg = None
         if not self.all_pages.get():
             try:
                 start = int(self.start_page.get())
@@ -773,10 +1353,57 @@ class MarkerGUI:
                 messagebox.showerror("Invalid Page Range", 
                     "Please enter valid page numbers.\nStart page must be >= 1 and <= End page.")
                 return False
+            # Convert 1-based user input to 0-based for marker
+            self._page_range_arg = f"{start - 1}-{end - 1}"
         return True
     
+    def scan_pdf_files(self, paths):
+        """Check the PDFs exist, listing and stat-ing each parent directory once.
+        
+        Returns (missing, devices): the paths that don't exist, and the st_dev
+        of each path's folder (None if unknown) for same-filesystem checks.
+        """
+        by_dir = defaultdict(set)
+        for path in paths:
+            by_dir[os.path.dirname(path)].add(os.path.basename(path))
+        
+        # One directory listing per folder instead of one stat per file
+        present = {}
+        folder_devices = {}
+        for directory in by_dir:
+            try:
+                with os.scandir(directory or ".") as entries:
+                    present[directory] = {entry.name for entry in entries if entry.is_file()}
+            except OSError:
+                present[directory] = set()
+            folder_devices[directory] = device_of(directory or ".")
+        
+        # A name can be absent from the listing yet still exist, differing only in
+        # case or Unicode normalization (macOS, Windows) - stat just those to be sure
+        missing = [
+            path for path in paths
+            if os.path.basename(path) not in present[os.path.dirname(path)]
+            and not os.path.exists(path)
+        ]
+        devices = {path: folder_devices[os.path.dirname(path)] for path in paths}
+        return missing, devices
+    
+    def validate_max_workers(self):
+        """Validate the worker count input, returning it as an int or None."""
+        from tkinter import messagebox
+        try:
+            max_workers = int(self.max_workers.get())
+            if max_workers < 1:
+                raise ValueError()
+        except ValueError:
+            messagebox.showerror("Invalid Workers",
+                "Please enter a valid number of workers (1 or more).")
+            return None
+        return max_workers
+    
     def start_conversion(self):
         """Start the PDF conversion process for all selected files."""
+        from tkinter import messagebox
         # Validate inputs
         if not self.pdf_files:
             messagebox.showwarning("Missing Input", "Please select at least one PDF file.")
@@ -787,7 +1414,7 @@ class MarkerGUI:
             return
         
         # Check all files exist
-        missing_files = [f for f in self.pdf_files if not Path(f).exists()]
+        missing_files, source_devices = self.scan_pdf_files(self.pdf_files)
         if missing_files:
             messagebox.showerror("Files Not Found", 
                 f"The following files were not found:\n" + "\n".join(missing_files))
@@ -797,187 +1424,350 @@ class MarkerGUI:
         if not self.validate_page_range():
             return
         
+        max_workers = self.validate_max_workers()
+        if max_workers is None:
+            return
+        
+        # Resolved once here, so edits made during the batch don't race it
+        pdf_files = list(self.pdf_files)
+        final_names = {pdf_path: self.get_final_name(pdf_path) for pdf_path in pdf_files}
+        base_output_dir = self.output_path.get()
+        
+        # Create every output folder up front, so a bad path fails before any conversion
+        if self.create_project_folder.get():
+            project_folders = {
+                pdf_path: os.path.join(base_output_dir, final_names[pdf_path])
+                for pdf_path in pdf_files
+            }
+        else:
+            project_folders = dict.fromkeys(pdf_files, base_output_dir)
+        
+        # PDFs with the same output name would overwrite each other's PDF and markdown
+        by_target = defaultdict(list)
+        for pdf_path in pdf_files:
+            by_target[output_target(project_folders[pdf_path], final_names[pdf_path])].append(pdf_path)
+        clashes = [paths for paths in by_target.values() if len(paths) > 1]
+        if clashes:
+            messagebox.showerror("Duplicate Output Names",
+                "These files would be saved under the same output name. "
+                "Give them different output names or remove one:\n\n" +
+                "\n\n".join("\n".join(paths) for paths in clashes))
+            return
+        
+        failed_folders = []
+        for folder in set(project_folders.values()):
+            try:
+                os.makedirs(folder, exist_ok=True)
+            except OSError as e:
+                failed_folders.append(f"{folder}: {e}")
+        if failed_folders:
+            messagebox.showerror("Cannot Create Folders",
+                "The following output folders could not be created:\n" + "\n".join(failed_folders))
+            return
+        
         # Update UI state
         self.is_running = True
         self.convert_btn.config(state=tk.DISABLED)
         self.cancel_btn.config(state=tk.NORMAL)
         
         # Log start
-        total = len(self.pdf_files)
-        self.log(f"Starting conversion of {total} file{'s' if total > 1 else ''}...\n\n")
+        total = len(pdf_files)
+        self.log(f"Starting conversion of {total} file{'s' if total > 1 else ''}...\n\n", "hdr")
+        
+        # Whether each PDF can be renamed or hard linked into the output (None: unknown)
+        output_device = device_of(base_output_dir)
+        same_device = {
+            pdf_path: None if output_device is None or source_devices[pdf_path] is None
+            else source_devices[pdf_path] == output_device
+            for pdf_path in pdf_files
+        }
         
         # Capture current settings for the thread
         settings = {
-            'pdf_files': list(self.pdf_files),
-            'output_names': dict(self.output_names),
-            'create_project_folder': self.create_project_folder.get(),
+            'pdf_files': pdf_files,
+            'final_names': final_names,
+            'project_folders': project_folders,  # Already created
             'pdf_action': self.pdf_action.get(),  # "Move PDF", "Copy PDF", or "Do Nothing"
-            'base_output_dir': self.output_path.get()
+            'max_workers': max_workers,
+            'same_device': same_device,
+            'page_range_arg': self._page_range_arg
         }
         
-        # Run in background thread
-        thread = threading.Thread(target=self.run_conversion, args=(settings,), daemon=True)
-        thread.start()
+        # Run on the background event loop
+        asyncio.run_coroutine_threadsafe(self.run_conversion(settings), self._loop)
     
-    def run_conversion(self, settings):
-        """Run the conversion subprocess for each PDF file."""
+    async def run_conversion(self, settings):
+        """Convert all PDF files using a pool of marker workers."""
         pdf_files = settings['pdf_files']
         total = len(pdf_files)
-        successful = 0
-        failed = 0
+        
+        # Workers take the next PDF as soon as they finish the previous one
+        jobs = asyncio.Queue()
+        for index, pdf_path in enumerate(pdf_files, 1):
+            jobs.put_nowait((index, pdf_path))
+        
+        worker_count = min(settings['max_workers'], total)
+        
+        # Let go of workers beyond the Workers setting (it was lowered). A batch with
+        # fewer PDFs just leaves the extra ones idle, models still loaded.
+        surplus = [self._workers.pop(number) for number in list(self._workers)
+                   if number > settings['max_workers']]
+        if surplus:
+            await asyncio.gather(*(worker.stop() for worker in surplus))
+        
+        tasks = [
+            asyncio.ensure_future(self._worker_loop(number, worker_count, jobs, total, settings))
+            for number in range(1, worker_count + 1)
+        ]
         
         try:
-            for index, pdf_path in enumerate(pdf_files, 1):
-                if not self.is_running:
-                    break
-                
-                # Determine final name
-                final_name = self.get_final_name(pdf_path)
-                original_filename = Path(pdf_path).name
-                
-                # Log which file we're processing
-                self.root.after(0, self.log, f"[{index}/{total}] Converting: {original_filename}\n")
-                if final_name != Path(pdf_path).stem:
-                    self.root.after(0, self.log, f"    → Output name: {final_name}\n")
-                
-                # Determine output directory
-                base_output = settings['base_output_dir']
-                if settings['create_project_folder']:
-                    project_folder = Path(base_output) / final_name
-                    marker_output_dir = str(project_folder)
-                else:
-                    project_folder = Path(base_output)
-                    marker_output_dir = str(project_folder)
-                
-                # Create project folder if needed
-                try:
-                    project_folder.mkdir(parents=True, exist_ok=True)
-                except Exception as e:
-                    self.root.after(0, self.log, f"\n✗ Failed to create folder: {e}\n\n")
-                    failed += 1
-                    continue
-                
-                # Determine the PDF path to use for marker based on pdf_action
-                current_pdf_path = pdf_path
-                pdf_action = settings['pdf_action']
-                new_pdf_path = project_folder / f"{final_name}.pdf"
-                
-                try:
-                    if pdf_action == "Move PDF" and Path(pdf_path) != new_pdf_path:
-                        self.root.after(0, self.log, f"    Moving PDF to: {new_pdf_path}\n")
-                        shutil.move(pdf_path, new_pdf_path)
-                        current_pdf_path = str(new_pdf_path)
-                    
-                    elif pdf_action == "Copy PDF" and Path(pdf_path) != new_pdf_path:
-                        self.root.after(0, self.log, f"    Copying PDF to: {new_pdf_path}\n")
-                        shutil.copy2(pdf_path, new_pdf_path)
-                        current_pdf_path = str(new_pdf_path)
-                    
-                    elif pdf_action == "Symbolic Link" and Path(pdf_path) != new_pdf_path:
-                        # Create symlink in output folder pointing to original
-                        self.root.after(0, self.log, f"    Creating symlink: {new_pdf_path} → {pdf_path}\n")
-                        if new_pdf_path.exists():
-                            new_pdf_path.unlink()
-                        new_pdf_path.symlink_to(Path(pdf_path).resolve())
-                        current_pdf_path = str(new_pdf_path)
-                    
-                    elif pdf_action == "Symbolic Backlink" and Path(pdf_path) != new_pdf_path:
-                        # Move PDF to output, then symlink back to original location
-                        original_path = Path(pdf_path)
-                        self.root.after(0, self.log, f"    Moving PDF to: {new_pdf_path}\n")
-                        shutil.move(pdf_path, new_pdf_path)
-                        self.root.after(0, self.log, f"    Creating backlink: {original_path} → {new_pdf_path}\n")
-                        original_path.symlink_to(new_pdf_path.resolve())
-                        current_pdf_path = str(new_pdf_path)
-                    
-                    # "Do Nothing" - leave current_pdf_path as is
-                    
-                except Exception as e:
-                    self.root.after(0, self.log, f"\n✗ Failed to handle PDF ({pdf_action}): {e}\n\n")
-                    failed += 1
-                    continue
-                
-                cmd = self.get_marker_command(current_pdf_path, marker_output_dir)
-                if cmd is None:
-                    failed += 1
-                    continue
-                
-                self.root.after(0, self.log, f"$ {' '.join(cmd)}\n\n")
-                
-                self.process = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
-                    env={**os.environ, "PYTHONUNBUFFERED": "1"}
-                )
-                
-                # Read output line by line
-                for line in iter(self.process.stdout.readline, ""):
-                    if not self.is_running:
-                        break
-                    self.root.after(0, self.log, line)
-                
-                self.process.stdout.close()
-                return_code = self.process.wait()
-                
-                if return_code == 0:
-                    successful += 1
-                    
-                    # Rename marker output folder to append _marker_output
-                    marker_created_folder = Path(marker_output_dir) / final_name
-                    marker_renamed_folder = Path(marker_output_dir) / f"{final_name}_marker_output"
-                    if marker_created_folder.exists() and marker_created_folder.is_dir():
-                        try:
-                            marker_created_folder.rename(marker_renamed_folder)
-                            self.root.after(0, self.log, f"    Renamed output folder to: {final_name}_marker_output\n")
-                        except Exception as e:
-                            self.root.after(0, self.log, f"    Warning: Could not rename output folder: {e}\n")
-                    
-                    self.root.after(0, self.log, f"\n✓ {final_name} completed successfully!\n\n")
-                elif self.is_running:
-                    failed += 1
-                    self.root.after(0, self.log, f"\n✗ {final_name} failed with exit code {return_code}\n\n")
+            results = [result for worker_results in await asyncio.gather(*tasks)
+                       for result in worker_results]
+            
+            # Workers that fail to start hand their PDF back to the queue; what is
+            # still there had no worker left to take it
+            if self.is_running and not jobs.empty():
+                self.log(f"\n✗ {jobs.qsize()} PDF(s) not converted: no marker worker could be started\n", "err")
+            successful = sum(1 for _, ok in results if ok)
+            failed = total - successful
             
             # Final summary
             if self.is_running:
-                self.root.after(0, self.log, 
+                self.log(
                     f"{'─' * 40}\n"
-                    f"Conversion complete: {successful} succeeded, {failed} failed\n"
+                    f"Conversion complete: {successful} succeeded, {failed} failed\n",
+                    "hdr"
                 )
         
-        except FileNotFoundError:
-            self.root.after(0, self.log, 
-                "\n✗ Error: marker_single not found.\n"
+        except FileNotFoundError as e:
+            self.log(
+                f"\n✗ Error: marker-pdf not found ({e}).\n"
                 "Make sure marker-pdf is installed in the .venv:\n"
-                "  .venv/bin/pip install marker-pdf\n"
+                "  .venv/bin/pip install marker-pdf\n",
+                "err"
             )
         except Exception as e:
-            self.root.after(0, self.log, f"\n✗ Error: {str(e)}\n")
+            self.log(f"\n✗ Error: {str(e)}\n", "err")
         finally:
+            # Stop the other workers after an error
+            for task in tasks:
+                task.cancel()
             self.root.after(0, self.conversion_finished)
     
+    async def _worker_loop(self, number, worker_count, jobs, total, settings):
+        """Run one marker worker, converting queued PDFs until none are left.
+        
+        Returns a (final_name, ok) tuple for each PDF this worker handled.
+        """
+        prefix = f"[worker {number}] " if worker_count > 1 else ""
+        worker = self._workers.get(number)
+        if worker is None:
+            worker = self._workers[number] = MarkerWorker(self._worker_cmd, self._env)
+        results = []
+        
+        try:
+            while self.is_running:
+                try:
+                    index, pdf_path = jobs.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                
+                # Start (or restart after a crash) before taking on the PDF
+                if not worker.alive:
+                    try:
+                        await self._start_worker(worker, number, prefix)
+                    except RuntimeError as e:
+                        # E.g. out of memory loading the models - the other workers
+                        # carry on with the queue, including this PDF
+                        jobs.put_nowait((index, pdf_path))
+                        self.log(f"{prefix}✗ {e}, continuing without this worker\n\n", "err")
+                        self._drop_worker(number, worker)
+                        return results
+                    if not self.is_running:
+                        break
+                
+                results.append(await self._convert_one(worker, pdf_path, index, total, settings))
+        except BaseException:
+            # Don't hand a worker in an unknown state to the next batch
+            self._drop_worker(number, worker)
+            raise
+        
+        # The worker stays loaded for the next batch
+        return results
+    
+    def _drop_worker(self, number, worker):
+        """Terminate worker and remove it from the pool."""
+        worker.terminate()
+        if self._workers.get(number) is worker:
+            del self._workers[number]
+    
+    async def _start_worker(self, worker, number, prefix):
+        """Launch a worker and wait for it to finish loading marker's models."""
+        self.log(f"{prefix}Starting marker worker and loading models...\n")
+        self.log(f"{prefix}$ {self._worker_cmd_display}\n")
+        await worker.start()
+        
+        # Cancel may have run while the process was starting
+        if not self.is_running:
+            worker.terminate()
+        
+        status = await worker.read_status(self.log, prefix)
+        if not self.is_running:
+            return
+        if status is None:
+            raise RuntimeError(f"marker worker exited during startup (code {worker.process.returncode})")
+        if status.get("event") != "ready":
+            raise FileNotFoundError(status.get("error", "unknown error"))
+        self.log(f"{prefix}Marker worker ready.\n\n")
+    
+    async def _convert_one(self, worker, pdf_path, index, total, settings):
+        """Convert a single PDF with the given worker, returning (final_name, ok)."""
+        final_name = settings['final_names'][pdf_path]
+        src = Path(pdf_path)
+        original_filename = src.name
+        
+        # Prefix streamed output so interleaved lines from parallel workers stay readable
+        parallel = settings['max_workers'] > 1 and total > 1
+        prefix = f"[{index}/{total} {original_filename}] " if parallel else ""
+        
+        # Output directory, created by start_conversion. Marker saves straight
+        # into the suffixed folder, so there is nothing to rename afterwards.
+        project_folder = settings['project_folders'][pdf_path]
+        marker_output_dir = os.path.join(project_folder, final_name + "_marker_output")
+        
+        # Everything up to the conversion is logged as one block at the end, so
+        # a PDF's lines stay together when several workers run at once
+        header = f"[{index}/{total}] Converting: {original_filename}\n"
+        notes = []
+        if final_name != src.stem:
+            notes.append(f"    → Output name: {final_name}\n")
+        
+        # Moving/copying large PDFs blocks, so keep it off the event loop
+        try:
+            current_pdf_path = await asyncio.to_thread(
+                self.prepare_pdf, src, final_name, project_folder, settings['pdf_action'],
+                settings['same_device'][pdf_path], notes
+            )
+        except Exception as e:
+            self.log(header, "hdr")
+            self.log("".join(notes))
+            self.log(f"\n✗ Failed to handle PDF ({settings['pdf_action']}): {e}\n\n", "err")
+            return final_name, False
+        
+        job = self.get_marker_job(current_pdf_path, marker_output_dir, final_name, settings['page_range_arg'])
+        notes.append(f"{prefix}Converting {current_pdf_path} → {marker_output_dir}\n\n")
+        self.log(header, "hdr")
+        self.log("".join(notes))
+        
+        status = await worker.convert(job, self.log, prefix)
+        if not self.is_running:
+            return final_name, False
+        
+        if status is None:
+            self.log(f"\n✗ {final_name} failed: marker worker exited with code {worker.process.returncode}\n\n", "err")
+            return final_name, False
+        if not status.get("ok"):
+            self.log(f"\n✗ {final_name} failed: {status.get('error', 'unknown error')}\n\n", "err")
+            return final_name, False
+        
+        self.log(f"\n✓ {final_name} completed successfully!\n\n", "ok")
+        return final_name, True
+    
+    def prepare_pdf(self, src, final_name, project_folder, pdf_action, same_device=None, notes=None):
+        """Apply the PDF action to src (a Path), placing it in project_folder.
+        
+        same_device says whether src is on the output's filesystem (None if
+        unknown), so moves and hard links don't attempt what can't work.
+        What was done is appended to notes, a list of log lines, if given.
+        Returns the PDF path marker should convert; raises if the action fails.
+        """
+        if notes is None:
+            notes = []
+        # Determine the PDF path to use for marker based on pdf_action
+        current_pdf_path = str(src)
+        new_pdf_path = os.path.join(project_folder, final_name + ".pdf")
+        
+        # Nothing to move, copy or link if the PDF is already there (e.g. a re-run)
+        try:
+            if os.path.samefile(src, new_pdf_path):
+                # Convert the output copy so the markdown is named after it
+                return current_pdf_path if pdf_action == "Do Nothing" else new_pdf_path
+        except OSError:
+            pass  # new_pdf_path doesn't exist yet
+        
+        if pdf_action == "Move PDF":
+            notes.append(f"    Moving PDF to: {new_pdf_path}\n")
+            fast_move(src, new_pdf_path, same_device)
+            current_pdf_path = new_pdf_path
+        
+        elif pdf_action == "Copy PDF":
+            notes.append(f"    Copying PDF to: {new_pdf_path}\n")
+            fast_copy(src, new_pdf_path)
+            current_pdf_path = new_pdf_path
+        
+        elif pdf_action == "Hard Link":
+            # Same file under a second name - no bytes copied on the same filesystem
+            notes.append(f"    Hard linking PDF to: {new_pdf_path}\n")
+            Path(new_pdf_path).unlink(missing_ok=True)
+            try:
+                if same_device is False:
+                    raise OSError("different filesystem")
+                os.link(src, new_pdf_path)
+            except OSError:
+                # Other filesystem, or one without hard links
+                notes.append("    Hard link not possible, copying instead\n")
+                fast_copy(src, new_pdf_path)
+            current_pdf_path = new_pdf_path
+        
+        elif pdf_action == "Symbolic Link":
+            # Create symlink in output folder pointing to original
+            notes.append(f"    Creating symlink: {new_pdf_path} → {src}\n")
+            dst = Path(new_pdf_path)
+            dst.unlink(missing_ok=True)
+            dst.symlink_to(src.resolve())
+            current_pdf_path = new_pdf_path
+        
+        elif pdf_action == "Symbolic Backlink":
+            # Move PDF to output, then symlink back to original location
+            notes.append(f"    Moving PDF to: {new_pdf_path}\n")
+            fast_move(src, new_pdf_path, same_device)
+            notes.append(f"    Creating backlink: {src} → {new_pdf_path}\n")
+            src.symlink_to(Path(new_pdf_path).resolve())
+            current_pdf_path = new_pdf_path
+        
+        # "Do Nothing" - leave current_pdf_path as is
+        
+        return current_pdf_path
+    
     def conversion_finished(self):
         """Reset UI state after conversion ends."""
         self.is_running = False
-        self.process = None
         self.convert_btn.config(state=tk.NORMAL)
         self.cancel_btn.config(state=tk.DISABLED)
+        # Show the summary now instead of at the next drain
+        self._drain_log_queue()
     
     def cancel_conversion(self):
         """Cancel the running conversion."""
-        if self.process and self.is_running:
+        if self.is_running:
             self.is_running = False
-            self.process.terminate()
-            self.log("\n⚠ Conversion cancelled by user.\n")
+            self._loop.call_soon_threadsafe(self._cancel_all)
+            self.log("\n⚠ Conversion cancelled by user.\n", "err")
+            self._drain_log_queue()
+    
+    def _cancel_all(self):
+        """Terminate every marker worker, busy or idle (runs on the event loop)."""
+        workers = list(self._workers.values())
+        self._workers.clear()
+        for worker in workers:
+            worker.terminate()
 
 
 def main():
     root = tk.Tk()
     
     # Set a nicer theme on macOS/Windows
-    if sys.platform == "darwin":
+    if IS_MAC:
         root.tk.call("tk", "scaling", 1.5)
     
     try:
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Marker conversion worker used by marker.py.
+Loads marker's models once, then converts one PDF per JSON job line on stdin.
+"""
+
+import json
+import os
+import sys
+import traceback
+
+# Marks status lines so the GUI can tell them apart from marker's own output
+STATUS_PREFIX = "\x1emarker-worker:"
+
+
+def send_status(event, **fields):
+    """Report a status event to the GUI on stdout."""
+    print(f"{STATUS_PREFIX}{json.dumps({'event': event, **fields})}", flush=True)
+
+
+def convert(job, models, ConfigParser, save_output):
+    """Convert a single PDF the same way marker_single does.
+
+    Output goes straight into job["output_folder"] as job["base_name"].md,
+    rather than the <output_dir>/<pdf name> folder and name marker_single
+    would pick.
+    """
+    out_folder = job["output_folder"]
+    options = {"output_dir": os.path.dirname(out_folder), "output_format": "markdown"}
+    if job.get("page_range"):
+        options["page_range"] = job["page_range"]
+
+    config_parser = ConfigParser(options)
+    converter_cls = config_parser.get_converter_cls()
+    converter = converter_cls(
+        config=config_parser.generate_config_dict(),
+        artifact_dict=models,
+        processor_list=config_parser.get_processors(),
+        renderer=config_parser.get_renderer(),
+        llm_service=config_parser.get_llm_service()
+    )
+    rendered = converter(job["pdf"])
+    os.makedirs(out_folder, exist_ok=True)
+    save_output(rendered, out_folder, job["base_name"])
+    print(f"Saved markdown to {out_folder}", flush=True)
+
+
+def main():
+    # The GUI decodes our output as UTF-8; on Windows pipes default to the ANSI code page
+    for stream in (sys.stdout, sys.stderr):
+        stream.reconfigure(encoding="utf-8", errors="backslashreplace")
+
+    # This folder also holds marker.py, which would shadow the marker package
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    sys.path[:] = [p for p in sys.path if os.path.abspath(p or os.curdir) != script_dir]
+
+    # Let unsupported ops fall back to CPU on Apple Silicon
+    os.environ.setdefault("PYTORCH_ENABLE_MPS_FALLBACK", "1")
+
+    try:
+        from marker.config.parser import ConfigParser
+        from marker.models import create_model_dict
+        from marker.output import save_output
+    except ImportError as e:
+        send_status("error", error=str(e))
+        return 1
+
+    # The expensive part - done once for every PDF this worker converts
+    models = create_model_dict()
+    send_status("ready")
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            convert(json.loads(line), models, ConfigParser, save_output)
+            send_status("done", ok=True)
+        except Exception as e:
+            traceback.print_exc(file=sys.stdout)
+            send_status("done", ok=False, error=str(e))
+
+    # stdin closed - the GUI is done with this worker
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())